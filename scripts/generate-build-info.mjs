@@ -5,7 +5,7 @@
  * Run before `tsc` so the values are baked into the compiled JS.
  */
 
-import { readFileSync, writeFileSync } from "fs";
+import { readFileSync, renameSync, writeFileSync } from "fs";
 import { fileURLToPath } from "url";
 import { dirname, join } from "path";
 
@@ -17,5 +17,10 @@ export const VERSION = "${pkg.version}";
 export const BUILD_TIME = "${new Date().toISOString()}";
 `;
 
-writeFileSync(join(__dirname, "..", "src", "build-info.ts"), content);
+// Write to a temp file and rename so an interrupted build never leaves tsc a
+// truncated build-info.ts.
+const target = join(__dirname, "..", "src", "build-info.ts");
+const tmp = `${target}.${process.pid}.tmp`;
+writeFileSync(tmp, content);
+renameSync(tmp, target);
 console.error(`build-info.ts generated: v${pkg.version}`);
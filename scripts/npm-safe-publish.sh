@@ -19,8 +19,12 @@ set -euo pipefail
 #
 
 MAX_RETRIES=5
-PKG_NAME=$(node -p "require('./package.json').name")
-LOCAL_VERSION=$(node -p "require('./package.json').version")
+# One private log file for every publish attempt in this run, removed on exit.
+PUBLISH_LOG=$(mktemp "${TMPDIR:-/tmp}/npm-publish-output.XXXXXX")
+trap 'rm -f "$PUBLISH_LOG"' EXIT
+
+# Read name and version in one node startup instead of parsing package.json twice.
+read -r PKG_NAME LOCAL_VERSION < <(node -p "const pkg = require('./package.json'); pkg.name + ' ' + pkg.version")
 
 echo "==> Package: $PKG_NAME"
 echo "==> Local version: $LOCAL_VERSION"
@@ -30,15 +34,18 @@ NPM_VERSION=$(npm view "$PKG_NAME" version 2>/dev/null || echo "0.0.0")
 echo "==> npm version: $NPM_VERSION"
 
 # Pick the higher semver of local vs npm
+# Versions are passed as argv rather than spliced into the script source, so
+# registry output can never be evaluated as JavaScript.
 pick_higher() {
   node -e "
-    const [a, b] = ['$1', '$2'].map(v => v.split('.').map(Number));
+    const [left, right] = process.argv.slice(1);
+    const [a, b] = [left, right].map(v => v.split('.').map(Number));
     for (let i = 0; i < 3; i++) {
-      if (a[i] > b[i]) { console.log('$1'); process.exit(); }
-      if (a[i] < b[i]) { console.log('$2'); process.exit(); }
+      if (a[i] > b[i]) { console.log(left); process.exit(); }
+      if (a[i] < b[i]) { console.log(right); process.exit(); }
     }
-    console.log('$1');
-  "
+    console.log(left);
+  " "$1" "$2"
 }
 
 BASE_VERSION=$(pick_higher "$LOCAL_VERSION" "$NPM_VERSION")
@@ -47,10 +54,10 @@ echo "==> Base version (higher of local/npm): $BASE_VERSION"
 # Bump patch from the base
 bump_patch() {
   node -e "
-    const parts = '$1'.split('.').map(Number);
+    const parts = process.argv[1].split('.').map(Number);
     parts[2]++;
     console.log(parts.join('.'));
-  "
+  " "$1"
 }
 
 NEXT_VERSION=$(bump_patch "$BASE_VERSION")
@@ -67,7 +74,7 @@ for attempt in $(seq 1 $MAX_RETRIES); do
   npm run build
 
   # Try publish
-  if npm publish --access public 2>&1 | tee /tmp/npm-publish-output.txt; then
+  if npm publish --access public 2>&1 | tee "$PUBLISH_LOG"; then
     echo ""
     echo "==> Successfully published $PKG_NAME@$NEXT_VERSION"
 
@@ -82,13 +89,12 @@ for attempt in $(seq 1 $MAX_RETRIES); do
   fi
 
   # Check if it was a version conflict (E403)
-  if grep -q "cannot publish over the previously published" /tmp/npm-publish-output.txt 2>/dev/null || \
-     grep -q "E403" /tmp/npm-publish-output.txt 2>/dev/null; then
+  if grep -qE "cannot publish over the previously published|E403" "$PUBLISH_LOG" 2>/dev/null; then
     echo "==> Version $NEXT_VERSION already exists on npm, bumping..."
     NEXT_VERSION=$(bump_patch "$NEXT_VERSION")
   else
     echo "==> Publish failed for a non-version reason. Aborting."
-    cat /tmp/npm-publish-output.txt
+    cat "$PUBLISH_LOG"
     exit 1
   fi
 done
@@ -9,6 +9,9 @@ const PLUGIN_ROOT = resolve(__dirname, "..");
 const DEFAULT_CONVEX_URL = process.env.LIFEOS_CONVEX_URL || process.env.CONVEX_URL;
 const DEFAULT_API_KEY = process.env.LIFEOS_API_KEY;
 const DEFAULT_USER_ID = process.env.LIFEOS_USER_ID;
+// opencode stderr is kept for error messages and saved as artifact rawJson;
+// keep only the tail so chatty logs cannot exceed Convex's document size limit.
+const MAX_STDERR_BYTES = 64 * 1024;
 
 function parseArgs(argv) {
   const args = {
@@ -158,17 +161,41 @@ function runCommand(command, args, options = {}) {
       stdio: ["ignore", "pipe", "pipe"],
     });
 
-    let stdout = "";
-    let stderr = "";
-    child.stdout.on("data", (chunk) => {
-      stdout += chunk.toString();
-    });
+    // Collect raw chunks and decode once at exit: cheaper than repeated string
+    // concatenation and never splits a multi-byte character across chunks.
+    const stdoutChunks = [];
+    const stderrChunks = [];
+    let stderrBytes = 0;
+    let stderrDroppedBytes = 0;
+    child.stdout.on("data", (chunk) => stdoutChunks.push(chunk));
     child.stderr.on("data", (chunk) => {
-      stderr += chunk.toString();
+      stderrChunks.push(chunk);
+      stderrBytes += chunk.length;
+      while (stderrBytes - stderrChunks[0].length >= MAX_STDERR_BYTES) {
+        const dropped = stderrChunks.shift();
+        stderrBytes -= dropped.length;
+        stderrDroppedBytes += dropped.length;
+      }
     });
     child.on("error", reject);
     child.on("close", (code) => {
       const latencyMs = Date.now() - startedAt;
+      const stdout = Buffer.concat(stdoutChunks).toString("utf8");
+      let stderrTail = Buffer.concat(stderrChunks);
+      if (stderrDroppedBytes > 0) {
+        // The kept tail may start mid-character; skip UTF-8 continuation
+        // bytes so it does not decode with a leading replacement character.
+        let start = 0;
+        while (start < stderrTail.length && (stderrTail[start] & 0xc0) === 0x80) {
+          start += 1;
+        }
+        stderrTail = stderrTail.subarray(start);
+        stderrDroppedBytes += start;
+      }
+      const stderr =
+        (stderrDroppedBytes > 0
+          ? `[${stderrDroppedBytes} earlier stderr bytes omitted]\n`
+          : "") + stderrTail.toString("utf8");
       if (code === 0) {
         resolvePromise({ stdout: stdout.trim(), stderr: stderr.trim(), latencyMs });
         return;
@@ -321,9 +348,11 @@ async function main() {
     return;
   }
 
-  const prompt = await loadPrompt(args);
-  const config = await loadConfig(args);
-  const opencodeVersion = await getOpencodeVersion();
+  const [prompt, config, opencodeVersion] = await Promise.all([
+    loadPrompt(args),
+    loadConfig(args),
+    getOpencodeVersion(),
+  ]);
   const modelRoster = config.participants.map((model) => ({
     id: model.id,
     name: model.name,
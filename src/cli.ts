@@ -70,6 +70,11 @@ const SURREAL_MUTATING_KEYWORDS = [
   "UPDATE",
   "UPSERT",
 ];
+const SURREAL_READ_ONLY_STATEMENTS = new Set(["SELECT", "INFO", "EXPLAIN"]);
+const SURREAL_MUTATING_KEYWORD_PATTERN = new RegExp(
+  `\\b(${SURREAL_MUTATING_KEYWORDS.join("|")})\\b`,
+  "i",
+);
 
 type SurrealSqlResult = {
   status?: string;
@@ -88,92 +93,71 @@ type SurrealConfig = {
 
 type JsonObject = Record<string, unknown>;
 function usage(): never {
-  console.error(`lifeos v${VERSION} (built ${BUILD_TIME})`);
-  console.error("");
-  console.error("Usage: lifeos <tool_name> [key=value ...]");
-  console.error("       lifeos ppv <action> [key=value ...]");
-  console.error("       lifeos graph <action> [key=value ...]");
   console.error(
-    "       lifeos surreal <schema|query|link|unlink> [key=value ...]",
+    [
+      `lifeos v${VERSION} (built ${BUILD_TIME})`,
+      "",
+      "Usage: lifeos <tool_name> [key=value ...]",
+      "       lifeos ppv <action> [key=value ...]",
+      "       lifeos graph <action> [key=value ...]",
+      "       lifeos surreal <schema|query|link|unlink> [key=value ...]",
+      "",
+      "Examples:",
+      "  lifeos get_clients",
+      "  lifeos get_client clientId=abc123",
+      "  lifeos get_tasks status=todo limit=10",
+      '  lifeos get_contact_dossier nameQuery="mindworks"',
+      "  lifeos get_ppv_workspace",
+      "  lifeos get_active_vision_graph",
+      "  lifeos ppv workspace",
+      "  lifeos ppv graph recentVoiceLimit=8 recentVoiceLookbackDays=21",
+      "  lifeos ppv frictions visionIds=" +
+        "'" +
+        '["ppv1_visions:abc123"]' +
+        "'",
+      '  lifeos ppv create-friction type=fear title="Launch fear" belief="I might miss the moment" reframe="Ship a small field note this week" visionIds=' +
+        "'" +
+        '["ppv1_visions:abc123"]' +
+        "'",
+      "  lifeos ppv update-friction beliefId=life_beliefReframes:abc123 status=resolved isResolved=true",
+      "  lifeos graph vision recentVoiceLimit=8 recentVoiceLookbackDays=21",
+      "  lifeos graph project projectIdOrKey=ACME maxHops=2",
+      "  lifeos graph initiative initiativeId=lifeos_initiatives:abc123",
+      "  lifeos graph cache",
+      "  lifeos graph refresh-cache",
+      '  lifeos graph link fromNodeId=ppv1_visions:abc toNodeId=lifeos_pmProjects:def kind=supports evidence="Vision supports this project"',
+      "  lifeos surreal schema",
+      '  lifeos surreal query query="SELECT id, title FROM ppv1_visions LIMIT 5;"',
+      '  lifeos surreal link fromTable=ppv1_pillars fromId=abc toTable=lifeos_pmProjects toId=def kind=supports reason="Pillar supports project" confidence=0.8',
+      "  lifeos ppv activate-vision visionId=ppv1_visions:abc123",
+      "  lifeos ppv archive-vision visionId=ppv1_visions:abc123",
+      "  lifeos ppv delete-vision visionId=ppv1_visions:abc123",
+      "  lifeos set_active_ppv_vision visionId=ppv1_visions:abc123",
+      "  lifeos get_voice_memos_by_labels labels=" +
+        "'" +
+        '["focus","idea"]' +
+        "'",
+      "  lifeos get_voice_memos_by_labels tags=" +
+        "'" +
+        '["journal"]' +
+        "' isSummarized=false",
+      '  lifeos create_ai_convo_summary title="Weekly reflection" tags=' +
+        "'" +
+        '["reflection","weekly"]' +
+        "'",
+      "",
+      "Environment variables:",
+      "  CONVEX_URL        Convex deployment URL (required)",
+      "  LIFEOS_CONVEX_URL Convex deployment URL alias",
+      "  LIFEOS_USER_ID    Default user ID (required)",
+      "  LIFEOS_API_KEY    API key for authentication (optional)",
+      "  SURREAL_ENDPOINT  SurrealDB endpoint for lifeos surreal commands",
+      "  SURREAL_USER      SurrealDB username",
+      "  SURREAL_PASS      SurrealDB password",
+      "  SURREAL_NS        SurrealDB namespace (default: lifeos)",
+      "  SURREAL_DB        SurrealDB database (default: graph)",
+    ].join("\n"),
   );
-  console.error("");
-  console.error("Examples:");
-  console.error("  lifeos get_clients");
-  console.error("  lifeos get_client clientId=abc123");
-  console.error("  lifeos get_tasks status=todo limit=10");
-  console.error('  lifeos get_contact_dossier nameQuery="mindworks"');
-  console.error("  lifeos get_ppv_workspace");
-  console.error("  lifeos get_active_vision_graph");
-  console.error("  lifeos ppv workspace");
-  console.error(
-    "  lifeos ppv graph recentVoiceLimit=8 recentVoiceLookbackDays=21",
-  );
-  console.error(
-    "  lifeos ppv frictions visionIds=" + "'" + '["ppv1_visions:abc123"]' + "'",
-  );
-  console.error(
-    '  lifeos ppv create-friction type=fear title="Launch fear" belief="I might miss the moment" reframe="Ship a small field note this week" visionIds=' +
-      "'" +
-      '["ppv1_visions:abc123"]' +
-      "'",
-  );
-  console.error(
-    "  lifeos ppv update-friction beliefId=life_beliefReframes:abc123 status=resolved isResolved=true",
-  );
-  console.error(
-    "  lifeos graph vision recentVoiceLimit=8 recentVoiceLookbackDays=21",
-  );
-  console.error("  lifeos graph project projectIdOrKey=ACME maxHops=2");
-  console.error(
-    "  lifeos graph initiative initiativeId=lifeos_initiatives:abc123",
-  );
-  console.error("  lifeos graph cache");
-  console.error("  lifeos graph refresh-cache");
-  console.error(
-    '  lifeos graph link fromNodeId=ppv1_visions:abc toNodeId=lifeos_pmProjects:def kind=supports evidence="Vision supports this project"',
-  );
-  console.error("  lifeos surreal schema");
-  console.error(
-    '  lifeos surreal query query="SELECT id, title FROM ppv1_visions LIMIT 5;"',
-  );
-  console.error(
-    '  lifeos surreal link fromTable=ppv1_pillars fromId=abc toTable=lifeos_pmProjects toId=def kind=supports reason="Pillar supports project" confidence=0.8',
-  );
-  console.error("  lifeos ppv activate-vision visionId=ppv1_visions:abc123");
-  console.error("  lifeos ppv archive-vision visionId=ppv1_visions:abc123");
-  console.error("  lifeos ppv delete-vision visionId=ppv1_visions:abc123");
-  console.error("  lifeos set_active_ppv_vision visionId=ppv1_visions:abc123");
-  console.error(
-    "  lifeos get_voice_memos_by_labels labels=" +
-      "'" +
-      '["focus","idea"]' +
-      "'",
-  );
-  console.error(
-    "  lifeos get_voice_memos_by_labels tags=" +
-      "'" +
-      '["journal"]' +
-      "' isSummarized=false",
-  );
-  console.error(
-    '  lifeos create_ai_convo_summary title="Weekly reflection" tags=' +
-      "'" +
-      '["reflection","weekly"]' +
-      "'",
-  );
-  console.error("");
-  console.error("Environment variables:");
-  console.error("  CONVEX_URL        Convex deployment URL (required)");
-  console.error("  LIFEOS_CONVEX_URL Convex deployment URL alias");
-  console.error("  LIFEOS_USER_ID    Default user ID (required)");
-  console.error("  LIFEOS_API_KEY    API key for authentication (optional)");
-  console.error(
-    "  SURREAL_ENDPOINT  SurrealDB endpoint for lifeos surreal commands",
-  );
-  console.error("  SURREAL_USER      SurrealDB username");
-  console.error("  SURREAL_PASS      SurrealDB password");
-  console.error("  SURREAL_NS        SurrealDB namespace (default: lifeos)");
-  console.error("  SURREAL_DB        SurrealDB database (default: graph)");
   process.exit(1);
 }
 
@@ -242,71 +226,31 @@ function requireSurrealConfig(): SurrealConfig {
   };
 }
 
-function stripSqlCommentsAndStrings(sql: string): string {
-  let output = "";
-  let index = 0;
-  let quote: "'" | '"' | "`" | null = null;
-
-  while (index < sql.length) {
-    const current = sql[index]!;
-    const next = sql[index + 1];
-
-    if (quote) {
-      if (current === "\\" && next !== undefined) {
-        output += "  ";
-        index += 2;
-        continue;
-      }
-      if (current === quote) quote = null;
-      output += " ";
-      index += 1;
-      continue;
-    }
+// Line comments, block comments, and quoted strings (with backslash escapes).
+// Unterminated comments and strings run to the end of the input.
+const SQL_COMMENT_OR_STRING_PATTERN =
+  /--[^\n]*|\/\*[\s\S]*?(?:\*\/|$)|(['"`])(?:\\[\s\S]?|(?!\1)[^\\])*\1?/g;
 
-    if (current === "-" && next === "-") {
-      while (index < sql.length && sql[index] !== "\n") {
-        output += " ";
-        index += 1;
-      }
-      continue;
-    }
-
-    if (current === "/" && next === "*") {
-      output += "  ";
-      index += 2;
-      while (
-        index < sql.length &&
-        !(sql[index] === "*" && sql[index + 1] === "/")
-      ) {
-        output += " ";
-        index += 1;
-      }
-      if (index < sql.length) {
-        output += "  ";
-        index += 2;
-      }
-      continue;
-    }
-
-    if (current === "'" || current === '"' || current === "`") {
-      quote = current;
-      output += " ";
-      index += 1;
-      continue;
-    }
+function stripSqlCommentsAndStrings(sql: string): string {
+  // Blank out matches in place so offsets in the result line up with the input.
+  return sql.replace(SQL_COMMENT_OR_STRING_PATTERN, (match) =>
+    " ".repeat(match.length),
+  );
+}
 
-    output += current;
-    index += 1;
+function splitSqlStatements(sql: string): string[] {
+  const statements: string[] = [];
+  for (const part of stripSqlCommentsAndStrings(sql).split(";")) {
+    const statement = part.trim();
+    if (statement) statements.push(statement);
   }
-
-  return output;
+  return statements;
 }
 
-function splitSqlStatements(sql: string): string[] {
-  return stripSqlCommentsAndStrings(sql)
-    .split(";")
-    .map((statement) => statement.trim())
-    .filter(Boolean);
+// The space-delimited first word, upper-cased; empty when there is no space.
+function leadingKeyword(statement: string): string {
+  const space = statement.indexOf(" ");
+  return space === -1 ? "" : statement.slice(0, space).toUpperCase();
 }
 
 function assertReadOnlySurrealSql(sql: string): void {
@@ -317,26 +261,23 @@ function assertReadOnlySurrealSql(sql: string): void {
   }
 
   for (const statement of statements) {
-    const upper = statement.toUpperCase();
-    if (
-      !upper.startsWith("SELECT ") &&
-      !upper.startsWith("INFO ") &&
-      !upper.startsWith("EXPLAIN ")
-    ) {
+    const keyword = leadingKeyword(statement);
+    if (!SURREAL_READ_ONLY_STATEMENTS.has(keyword)) {
       throw new Error(
         "lifeos surreal query only allows SELECT, INFO, and EXPLAIN statements. Use lifeos surreal link for controlled relationship writes.",
       );
     }
 
-    for (const keyword of SURREAL_MUTATING_KEYWORDS) {
-      if (new RegExp(`\\b${keyword}\\b`, "i").test(statement)) {
-        throw new Error(`Blocked mutating SurrealQL keyword: ${keyword}`);
-      }
+    const mutating = SURREAL_MUTATING_KEYWORD_PATTERN.exec(statement);
+    if (mutating) {
+      throw new Error(
+        `Blocked mutating SurrealQL keyword: ${mutating[1]!.toUpperCase()}`,
+      );
     }
 
     const isAggregateCount = /\bCOUNT\s*\(/i.test(statement);
     if (
-      upper.startsWith("SELECT ") &&
+      keyword === "SELECT" &&
       !/\bLIMIT\b/i.test(statement) &&
       !isAggregateCount
     ) {
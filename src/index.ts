@@ -6466,6 +6466,8 @@ const PROMPTS: Prompt[] = [
   },
 ];
 
+const PROMPTS_BY_NAME = new Map(PROMPTS.map((prompt) => [prompt.name, prompt]));
+
 // Prompt message templates keyed by prompt name
 const PROMPT_MESSAGES: Record<
   string,
@@ -7534,8 +7536,9 @@ const CONVEX_URL =
   options.url || process.env.CONVEX_URL || process.env.LIFEOS_CONVEX_URL;
 const API_KEY = options.apiKey || process.env.LIFEOS_API_KEY;
 const USER_ID = options.userId || process.env.LIFEOS_USER_ID;
-const FALKOR_BROWSER_ENDPOINT =
-  process.env.FALKOR_BROWSER_ENDPOINT || "https://falkordb.apps.rjlabs.dev";
+const FALKOR_BROWSER_ENDPOINT = (
+  process.env.FALKOR_BROWSER_ENDPOINT || "https://falkordb.apps.rjlabs.dev"
+).replace(/\/$/, "");
 const FALKOR_GRAPH = process.env.FALKOR_GRAPH || "lifeos_ppv";
 const FALKOR_USER = process.env.FALKOR_USER || "default";
 const FALKOR_PASS = process.env.FALKOR_PASS;
@@ -7608,6 +7611,10 @@ async function callConvexTool(
   return result.result;
 }
 
+async function readJsonPayload(file: string): Promise<Record<string, unknown>> {
+  return JSON.parse(await readFile(file, "utf8")) as Record<string, unknown>;
+}
+
 async function runDirectCliCommand(command: DirectCliCommand): Promise<void> {
   if (command.kind === "agenda") {
     const scope = command.scope.toLowerCase();
@@ -7686,12 +7693,7 @@ async function runDirectCliCommand(command: DirectCliCommand): Promise<void> {
       );
     }
 
-    const payload = command.file
-      ? (JSON.parse(await readFile(command.file, "utf8")) as Record<
-          string,
-          unknown
-        >)
-      : {};
+    const payload = command.file ? await readJsonPayload(command.file) : {};
     if (command.action === "resolve-friction") {
       payload.status ??= "resolved";
       payload.isResolved ??= true;
@@ -7716,12 +7718,7 @@ async function runDirectCliCommand(command: DirectCliCommand): Promise<void> {
       );
     }
 
-    const payload = command.file
-      ? (JSON.parse(await readFile(command.file, "utf8")) as Record<
-          string,
-          unknown
-        >)
-      : {};
+    const payload = command.file ? await readJsonPayload(command.file) : {};
     if (command.summaryId) {
       payload.summaryId = command.summaryId;
     }
@@ -7769,10 +7766,7 @@ async function runDirectCliCommand(command: DirectCliCommand): Promise<void> {
     return;
   }
 
-  const patch = JSON.parse(await readFile(command.file, "utf8")) as Record<
-    string,
-    unknown
-  >;
+  const patch = await readJsonPayload(command.file);
   if (command.dryRun !== undefined) {
     patch.dryRun = command.dryRun;
   }
@@ -7802,6 +7796,14 @@ async function callConvexJsonEndpoint(
   return await response.json();
 }
 
+const LLM_COUNCIL_ARTIFACT_ACTIONS = new Map<string, string>([
+  ["create_llm_council_artifact_run", "createRun"],
+  ["append_llm_council_artifact", "appendArtifact"],
+  ["complete_llm_council_artifact_run", "completeRun"],
+  ["list_llm_council_artifact_runs", "listRuns"],
+  ["get_llm_council_artifact_run", "getRun"],
+]);
+
 async function callLlmCouncilArtifacts(
   action: string,
   params: Record<string, unknown>,
@@ -7816,66 +7818,16 @@ async function callLlmCouncilArtifacts(
 
 type JsonObject = Record<string, unknown>;
 
-function stripSqlCommentsAndStrings(sql: string): string {
-  let output = "";
-  let index = 0;
-  let quote: "'" | '"' | "`" | null = null;
-
-  while (index < sql.length) {
-    const current = sql[index]!;
-    const next = sql[index + 1];
-
-    if (quote) {
-      if (current === "\\" && next !== undefined) {
-        output += "  ";
-        index += 2;
-        continue;
-      }
-      if (current === quote) {
-        quote = null;
-      }
-      output += " ";
-      index += 1;
-      continue;
-    }
-
-    if (current === "-" && next === "-") {
-      while (index < sql.length && sql[index] !== "\n") {
-        output += " ";
-        index += 1;
-      }
-      continue;
-    }
-
-    if (current === "/" && next === "*") {
-      output += "  ";
-      index += 2;
-      while (
-        index < sql.length &&
-        !(sql[index] === "*" && sql[index + 1] === "/")
-      ) {
-        output += " ";
-        index += 1;
-      }
-      if (index < sql.length) {
-        output += "  ";
-        index += 2;
-      }
-      continue;
-    }
-
-    if (current === "'" || current === '"' || current === "`") {
-      quote = current;
-      output += " ";
-      index += 1;
-      continue;
-    }
+// Line comments, block comments, and quoted strings (with backslash escapes).
+// Unterminated comments and strings run to the end of the input.
+const SQL_COMMENT_OR_STRING_PATTERN =
+  /--[^\n]*|\/\*[\s\S]*?(?:\*\/|$)|(['"`])(?:\\[\s\S]?|(?!\1)[^\\])*\1?/g;
 
-    output += current;
-    index += 1;
-  }
-
-  return output;
+function stripSqlCommentsAndStrings(sql: string): string {
+  // Blank out matches in place so offsets in the result line up with the input.
+  return sql.replace(SQL_COMMENT_OR_STRING_PATTERN, (match) =>
+    " ".repeat(match.length),
+  );
 }
 
 function clampMaxRows(value: unknown): number {
@@ -7942,6 +7894,21 @@ const FALKOR_MUTATING_KEYWORDS = [
   "REMOVE",
   "SET",
 ];
+const FALKOR_READ_ONLY_CLAUSES = new Set([
+  "MATCH",
+  "WITH",
+  "RETURN",
+  "EXPLAIN",
+  "PROFILE",
+]);
+const FALKOR_TOKEN_TTL_SECONDS = 3600;
+// Re-mint a little before the browser token lapses so in-flight queries
+// never carry an expired token.
+const FALKOR_TOKEN_REFRESH_MARGIN_MS = 60_000;
+const FALKOR_MUTATING_KEYWORD_PATTERN = new RegExp(
+  `\\b(${FALKOR_MUTATING_KEYWORDS.join("|")})\\b`,
+  "i",
+);
 
 function requireFalkorConfig(): FalkorConfig {
   if (!FALKOR_TOKEN && !FALKOR_PASS) {
@@ -7967,7 +7934,7 @@ function sleep(ms: number) {
 }
 
 function cypherString(value: unknown) {
-  return `'${String(value).replace(/\\/g, "\\\\").replace(/'/g, "\\'")}'`;
+  return `'${String(value).replace(/[\\']/g, "\\$&")}'`;
 }
 
 function cypherValue(value: unknown): string {
@@ -7980,13 +7947,25 @@ function cypherValue(value: unknown): string {
   return cypherString(JSON.stringify(value));
 }
 
-function cypherProps(props: Record<string, unknown>) {
-  return `{${Object.entries(props)
-    .filter(([, value]) => value !== undefined)
-    .map(([key, value]) => `${key}: ${cypherValue(value)}`)
+// A property map whose values all reference same-named $params.
+function cypherParamProps(props: Record<string, unknown>) {
+  return `{${Object.keys(props)
+    .filter((key) => props[key] !== undefined)
+    .map((key) => `${key}: $${key}`)
     .join(", ")}}`;
 }
 
+// FalkorDB caches execution plans by query text with the CYPHER parameter
+// header removed. Passing every per-call value (ids, link properties,
+// timestamps) as $params keeps the link and unlink query text constant for a
+// given label pair, so repeated calls reuse one plan.
+function cypherParams(params: Record<string, unknown>) {
+  return `CYPHER ${Object.entries(params)
+    .filter(([, value]) => value !== undefined)
+    .map(([key, value]) => `${key}=${cypherValue(value)}`)
+    .join(" ")}`;
+}
+
 async function requestFalkorToken(config: FalkorConfig, attempt: number) {
   if (!config.password) {
     throw new Error("FALKOR_PASS is required when FALKOR_TOKEN is not set.");
@@ -7999,7 +7978,7 @@ async function requestFalkorToken(config: FalkorConfig, attempt: number) {
     Math.random().toString(36).slice(2, 10),
   ].join("-");
   const response = await fetch(
-    `${config.endpoint.replace(/\/$/, "")}/api/auth/tokens/credentials`,
+    `${config.endpoint}/api/auth/tokens/credentials`,
     {
       method: "POST",
       headers: { "Content-Type": "application/json" },
@@ -8010,7 +7989,7 @@ async function requestFalkorToken(config: FalkorConfig, attempt: number) {
         port: config.port,
         tls: config.tls,
         name: tokenName,
-        ttlSeconds: 3600,
+        ttlSeconds: FALKOR_TOKEN_TTL_SECONDS,
       }),
     },
   );
@@ -8028,9 +8007,30 @@ async function requestFalkorToken(config: FalkorConfig, attempt: number) {
   return parsed.token;
 }
 
-async function getFalkorToken(config: FalkorConfig) {
-  if (config.token) return config.token;
+let falkorTokenCache: { token: Promise<string>; expiresAt: number } | null =
+  null;
+
+function getFalkorToken(config: FalkorConfig): Promise<string> {
+  if (config.token) return Promise.resolve(config.token);
 
+  const now = Date.now();
+  if (falkorTokenCache && falkorTokenCache.expiresAt > now) {
+    return falkorTokenCache.token;
+  }
+
+  const token = mintFalkorToken(config);
+  falkorTokenCache = {
+    token,
+    expiresAt:
+      now + FALKOR_TOKEN_TTL_SECONDS * 1000 - FALKOR_TOKEN_REFRESH_MARGIN_MS,
+  };
+  token.catch(() => {
+    if (falkorTokenCache?.token === token) falkorTokenCache = null;
+  });
+  return token;
+}
+
+async function mintFalkorToken(config: FalkorConfig) {
   let lastError: unknown;
   for (let attempt = 0; attempt < 3; attempt += 1) {
     try {
@@ -8045,12 +8045,11 @@ async function getFalkorToken(config: FalkorConfig) {
 }
 
 function parseFalkorEventStream(text: string): FalkorQueryResult {
-  const data = text
-    .split(/\r?\n/)
-    .filter((line) => line.startsWith("data:"))
-    .map((line) => line.slice(5).trimStart())
-    .join("\n")
-    .trim();
+  const dataLines: string[] = [];
+  for (const line of text.split(/\r?\n/)) {
+    if (line.startsWith("data:")) dataLines.push(line.slice(5).trimStart());
+  }
+  const data = dataLines.join("\n").trim();
 
   if (!data) return { data: [], metadata: [] };
   return JSON.parse(data) as FalkorQueryResult;
@@ -8058,17 +8057,30 @@ function parseFalkorEventStream(text: string): FalkorQueryResult {
 
 async function runFalkorQuery(query: string): Promise<FalkorQueryResult> {
   const config = requireFalkorConfig();
-  const token = await getFalkorToken(config);
-  const url = `${config.endpoint.replace(/\/$/, "")}/api/graph/${encodeURIComponent(
+  const url = `${config.endpoint}/api/graph/${encodeURIComponent(
     config.graph,
   )}?query=${encodeURIComponent(query)}&timeout=30000`;
-  const response = await fetch(url, {
-    method: "GET",
-    headers: {
-      Authorization: `Bearer ${token}`,
-      Accept: "text/event-stream",
-    },
-  });
+  let usedToken: Promise<string> | undefined;
+  const send = async () => {
+    usedToken = getFalkorToken(config);
+    return fetch(url, {
+      method: "GET",
+      headers: {
+        Authorization: `Bearer ${await usedToken}`,
+        Accept: "text/event-stream",
+      },
+    });
+  };
+
+  let response = await send();
+  if (response.status === 401 && !config.token) {
+    // The cached credentials token was revoked or expired server-side. Only
+    // evict the token this request used, so a concurrent 401 does not discard
+    // a replacement another request already minted.
+    await response.text();
+    if (falkorTokenCache?.token === usedToken) falkorTokenCache = null;
+    response = await send();
+  }
 
   const text = await response.text();
   if (!response.ok) {
@@ -8078,6 +8090,12 @@ async function runFalkorQuery(query: string): Promise<FalkorQueryResult> {
   return parseFalkorEventStream(text);
 }
 
+// The space-delimited first word, upper-cased; empty when there is no space.
+function leadingKeyword(statement: string): string {
+  const space = statement.indexOf(" ");
+  return space === -1 ? "" : statement.slice(0, space).toUpperCase();
+}
+
 function assertReadOnlyFalkorCypher(query: string): void {
   const stripped = stripSqlCommentsAndStrings(query).trim();
   if (!stripped) throw new Error("FalkorDB Cypher query is empty.");
@@ -8087,30 +8105,23 @@ function assertReadOnlyFalkorCypher(query: string): void {
     );
   }
 
-  const upper = stripped.toUpperCase();
-  const startsReadOnly =
-    upper.startsWith("MATCH ") ||
-    upper.startsWith("WITH ") ||
-    upper.startsWith("RETURN ") ||
-    upper.startsWith("EXPLAIN ") ||
-    upper.startsWith("PROFILE ");
-  if (!startsReadOnly) {
+  const clause = leadingKeyword(stripped);
+  if (!FALKOR_READ_ONLY_CLAUSES.has(clause)) {
     throw new Error(
       "falkor_graph_query only allows read-only Cypher. Start with MATCH, WITH, RETURN, EXPLAIN, or PROFILE.",
     );
   }
 
-  for (const keyword of FALKOR_MUTATING_KEYWORDS) {
-    if (new RegExp(`\\b${keyword}\\b`, "i").test(stripped)) {
-      throw new Error(
-        `falkor_graph_query blocked mutating keyword ${keyword}. Use falkor_graph_link for guarded relationship writes.`,
-      );
-    }
+  const mutating = FALKOR_MUTATING_KEYWORD_PATTERN.exec(stripped);
+  if (mutating) {
+    throw new Error(
+      `falkor_graph_query blocked mutating keyword ${mutating[1]!.toUpperCase()}. Use falkor_graph_link for guarded relationship writes.`,
+    );
   }
 
   const isAggregateCount = /\bCOUNT\s*\(/i.test(stripped);
   if (
-    (upper.startsWith("MATCH ") || upper.startsWith("WITH ")) &&
+    (clause === "MATCH" || clause === "WITH") &&
     !/\bLIMIT\b/i.test(stripped) &&
     !isAggregateCount
   ) {
@@ -8368,7 +8379,7 @@ async function falkorGraphLink(args: Record<string, unknown>) {
       : {};
   const now = new Date().toISOString();
   const linkId = falkorLinkId({ fromLabel, fromId, toLabel, toId, kind });
-  const props = cypherProps({
+  const props = {
     linkId,
     kind,
     reason,
@@ -8380,21 +8391,13 @@ async function falkorGraphLink(args: Record<string, unknown>) {
     metadataJson: JSON.stringify(metadata),
     createdAt: now,
     updatedAt: now,
-  });
+  };
 
   await runFalkorQuery(
-    `MATCH (a:${fromLabel} {convexId: ${cypherString(
-      fromId,
-    )}})-[r:${FALKOR_AGENT_RELATIONSHIP} {linkId: ${cypherString(
-      linkId,
-    )}}]->(b:${toLabel} {convexId: ${cypherString(toId)}}) DELETE r`,
+    `${cypherParams({ fromId, toId, linkId })} MATCH (a:${fromLabel} {convexId: $fromId})-[r:${FALKOR_AGENT_RELATIONSHIP} {linkId: $linkId}]->(b:${toLabel} {convexId: $toId}) DELETE r`,
   );
   const result = await runFalkorQuery(
-    `MATCH (a:${fromLabel} {convexId: ${cypherString(
-      fromId,
-    )}}), (b:${toLabel} {convexId: ${cypherString(
-      toId,
-    )}}) CREATE (a)-[r:${FALKOR_AGENT_RELATIONSHIP} ${props}]->(b) RETURN r.linkId AS linkId, r.kind AS kind, r.reason AS reason, r.confidence AS confidence`,
+    `${cypherParams({ fromId, toId, ...props })} MATCH (a:${fromLabel} {convexId: $fromId}), (b:${toLabel} {convexId: $toId}) CREATE (a)-[r:${FALKOR_AGENT_RELATIONSHIP} ${cypherParamProps(props)}]->(b) RETURN r.linkId AS linkId, r.kind AS kind, r.reason AS reason, r.confidence AS confidence`,
   );
 
   return {
@@ -8416,11 +8419,7 @@ async function falkorGraphUnlink(args: Record<string, unknown>) {
   const kind = assertRelationKind(args.kind);
   const linkId = falkorLinkId({ fromLabel, fromId, toLabel, toId, kind });
   const result = await runFalkorQuery(
-    `MATCH (a:${fromLabel} {convexId: ${cypherString(
-      fromId,
-    )}})-[r:${FALKOR_AGENT_RELATIONSHIP} {linkId: ${cypherString(
-      linkId,
-    )}}]->(b:${toLabel} {convexId: ${cypherString(toId)}}) DELETE r`,
+    `${cypherParams({ fromId, toId, linkId })} MATCH (a:${fromLabel} {convexId: $fromId})-[r:${FALKOR_AGENT_RELATIONSHIP} {linkId: $linkId}]->(b:${toLabel} {convexId: $toId}) DELETE r`,
   );
 
   return {
@@ -8434,7 +8433,9 @@ async function falkorGraphUnlink(args: Record<string, unknown>) {
 type ClientRecord = {
   id: string;
   name: string;
-  raw: JsonObject;
+  slug: string;
+  lowerId: string;
+  lowerName: string;
 };
 
 type ResourceKind = "workspace" | "notes";
@@ -8566,21 +8567,54 @@ function formatCustomerSuccessGuide(): string {
   ].join("\n");
 }
 
-async function getClientsList(): Promise<ClientRecord[]> {
+// Resource list/read requests each need the client roster; keep it briefly so
+// a list followed by reads does not re-fetch get_clients for every URI.
+// Client writes through CallTool drop it so new or renamed clients resolve.
+const CLIENTS_CACHE_TTL_MS = 30_000;
+const CLIENT_MUTATING_TOOLS = new Set([
+  "create_client",
+  "update_client",
+  "delete_client",
+]);
+let clientsCache: {
+  expiresAt: number;
+  clients: Promise<ClientRecord[]>;
+} | null = null;
+
+function getClientsList(): Promise<ClientRecord[]> {
+  const now = Date.now();
+  if (clientsCache && clientsCache.expiresAt > now) {
+    return clientsCache.clients;
+  }
+
+  const clients = fetchClientsList();
+  clientsCache = { expiresAt: now + CLIENTS_CACHE_TTL_MS, clients };
+  clients.catch(() => {
+    if (clientsCache?.clients === clients) clientsCache = null;
+  });
+  return clients;
+}
+
+async function fetchClientsList(): Promise<ClientRecord[]> {
   const response = asJsonObject(await callConvexTool("get_clients", {}));
   const clients = asJsonArray(response.clients);
 
-  return clients
-    .map((client) => {
-      const id = getClientId(client);
-      const name = getClientName(client);
-      if (!id || !name) {
-        return null;
-      }
-
-      return { id, name, raw: client };
-    })
-    .filter((client): client is ClientRecord => client !== null);
+  const records: ClientRecord[] = [];
+  for (const client of clients) {
+    const id = getClientId(client);
+    const name = getClientName(client);
+    if (id && name) {
+      records.push({
+        id,
+        name,
+        slug: slugifyName(name),
+        lowerId: id.toLowerCase(),
+        lowerName: name.toLowerCase(),
+      });
+    }
+  }
+
+  return records;
 }
 
 async function resolveClient(clientIdOrName: string): Promise<ClientRecord> {
@@ -8589,9 +8623,9 @@ async function resolveClient(clientIdOrName: string): Promise<ClientRecord> {
 
   const exactMatch = clients.find((client) => {
     return (
-      client.id.toLowerCase() === lookup ||
-      client.name.toLowerCase() === lookup ||
-      slugifyName(client.name) === lookup
+      client.lowerId === lookup ||
+      client.lowerName === lookup ||
+      client.slug === lookup
     );
   });
 
@@ -8600,7 +8634,7 @@ async function resolveClient(clientIdOrName: string): Promise<ClientRecord> {
   }
 
   const partialMatch = clients.find((client) =>
-    client.name.toLowerCase().includes(lookup),
+    client.lowerName.includes(lookup),
   );
 
   if (partialMatch) {
@@ -8622,7 +8656,7 @@ async function listCustomerSuccessResources(): Promise<Resource[]> {
   const clientResources = clients.flatMap((client) => [
     {
       uri: buildClientResourceUri(client.id, "workspace"),
-      name: `client_workspace_${slugifyName(client.name) || client.id}`,
+      name: `client_workspace_${client.slug || client.id}`,
       title: `${client.name} Workspace`,
       mimeType: "text/markdown",
       description:
@@ -8630,7 +8664,7 @@ async function listCustomerSuccessResources(): Promise<Resource[]> {
     },
     {
       uri: buildClientResourceUri(client.id, "notes"),
-      name: `client_notes_${slugifyName(client.name) || client.id}`,
+      name: `client_notes_${client.slug || client.id}`,
       title: `${client.name} Notes`,
       mimeType: "text/markdown",
       description:
@@ -8862,7 +8896,7 @@ server.setRequestHandler(GetPromptRequestSchema, async (request) => {
     throw new Error(`Unknown prompt: ${name}`);
   }
 
-  const prompt = PROMPTS.find((p) => p.name === name);
+  const prompt = PROMPTS_BY_NAME.get(name);
   const messages = messageBuilder((args as Record<string, string>) || {});
 
   return {
@@ -8871,6 +8905,18 @@ server.setRequestHandler(GetPromptRequestSchema, async (request) => {
   };
 });
 
+// Tools answered in-process or by Falkor rather than by the Convex tool-call endpoint
+const DIRECT_TOOL_HANDLERS = new Map<
+  string,
+  (params: Record<string, unknown>) => unknown
+>([
+  ["falkor_graph_schema", () => falkorGraphSchema()],
+  ["falkor_graph_query", (params) => falkorGraphQuery(params)],
+  ["falkor_graph_link", (params) => falkorGraphLink(params)],
+  ["falkor_graph_unlink", (params) => falkorGraphUnlink(params)],
+  ["get_version", () => ({ version: VERSION, buildTime: BUILD_TIME })],
+]);
+
 // Handle tool calls
 server.setRequestHandler(CallToolRequestSchema, async (request) => {
   const { name, arguments: args } = request.params;
@@ -8898,16 +8944,10 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
       };
     }
 
-    const llmCouncilArtifactActions: Record<string, string> = {
-      create_llm_council_artifact_run: "createRun",
-      append_llm_council_artifact: "appendArtifact",
-      complete_llm_council_artifact_run: "completeRun",
-      list_llm_council_artifact_runs: "listRuns",
-      get_llm_council_artifact_run: "getRun",
-    };
-    if (name in llmCouncilArtifactActions) {
+    const llmCouncilArtifactAction = LLM_COUNCIL_ARTIFACT_ACTIONS.get(name);
+    if (llmCouncilArtifactAction) {
       const result = await callLlmCouncilArtifacts(
-        llmCouncilArtifactActions[name]!,
+        llmCouncilArtifactAction,
         (args as Record<string, unknown>) || {},
       );
 
@@ -8921,19 +8961,9 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
       };
     }
 
-    if (name === "falkor_graph_schema") {
-      return {
-        content: [
-          {
-            type: "text" as const,
-            text: JSON.stringify(falkorGraphSchema(), null, 2),
-          },
-        ],
-      };
-    }
-
-    if (name === "falkor_graph_query") {
-      const result = await falkorGraphQuery(
+    const directHandler = DIRECT_TOOL_HANDLERS.get(name);
+    if (directHandler) {
+      const result = await directHandler(
         (args as Record<string, unknown>) || {},
       );
 
@@ -8947,56 +8977,13 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
       };
     }
 
-    if (name === "falkor_graph_link") {
-      const result = await falkorGraphLink(
-        (args as Record<string, unknown>) || {},
-      );
-
-      return {
-        content: [
-          {
-            type: "text" as const,
-            text: JSON.stringify(result, null, 2),
-          },
-        ],
-      };
-    }
-
-    if (name === "falkor_graph_unlink") {
-      const result = await falkorGraphUnlink(
-        (args as Record<string, unknown>) || {},
-      );
-
-      return {
-        content: [
-          {
-            type: "text" as const,
-            text: JSON.stringify(result, null, 2),
-          },
-        ],
-      };
-    }
-
-    // Handle local-only tools (no Convex call needed)
-    if (name === "get_version") {
-      return {
-        content: [
-          {
-            type: "text" as const,
-            text: JSON.stringify(
-              { version: VERSION, buildTime: BUILD_TIME },
-              null,
-              2,
-            ),
-          },
-        ],
-      };
-    }
-
     const result = await callConvexTool(
       name,
       (args as Record<string, unknown>) || {},
     );
+    if (CLIENT_MUTATING_TOOLS.has(name)) {
+      clientsCache = null;
+    }
 
     return {
       content: [